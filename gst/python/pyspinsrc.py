@@ -1,7 +1,10 @@
+import ctypes
 import enum
+import fractions
 import math
-from dataclasses import dataclass
-from typing import Any, Callable, List, Optional, Tuple
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import gi
 
@@ -27,17 +30,65 @@ except ImportError:
     raise
 
 
+# gst-python logs Gst.info/Gst.log etc. through the "python" debug category
+_PYTHON_DEBUG_CATEGORY = next((cat for cat in Gst.debug_get_all_categories() if cat.get_name() == "python"), None)
+
+_CLOCK_TIME_NONE = Gst.CLOCK_TIME_NONE
+
+
+def _debug_level_enabled(level: Gst.DebugLevel) -> bool:
+    if _PYTHON_DEBUG_CATEGORY is None:
+        return Gst.debug_get_default_threshold() >= level
+    return _PYTHON_DEBUG_CATEGORY.get_threshold() >= level
+
+
+class CameraState(enum.IntEnum):
+    NONE = 0
+    SELECTED = 1
+    INITIALIZED = 2
+    STREAMING = 3
+
+
+@dataclass
+class NodeMeta:
+    """A typed node pointer with its accessors, access mode and range, valid while generation is current"""
+
+    node: Any
+    node_type: int
+    getter: Optional[Callable] = None
+    setter: Optional[Callable] = None
+    generation: int = -1
+    readable: bool = False
+    writable: bool = False
+    node_range: Optional[Tuple[Any, Any]] = None
+    enum_entries: Dict[str, int] = field(default_factory=dict)
+
+
 class ImageAcquirer:
 
     TIMEOUT_MS = 2000
 
+    _NODE_POINTER_TYPES = {
+        PySpin.intfIInteger: PySpin.CIntegerPtr,
+        PySpin.intfIFloat: PySpin.CFloatPtr,
+        PySpin.intfIBoolean: PySpin.CBooleanPtr,
+        PySpin.intfIEnumeration: PySpin.CEnumerationPtr,
+        PySpin.intfIString: PySpin.CStringPtr,
+        PySpin.intfICommand: PySpin.CCommandPtr,
+    }
+
     def __init__(self):
         self._system = PySpin.System.GetInstance()
         self._device_list = self._system.GetCameras()
         self._current_device = None
+        self._state = CameraState.NONE
         self._device_node_map = None
         self._tl_device_node_map = None
         self._tl_stream_node_map = None
+        self._node_cache: Dict[str, Optional[PySpin.INode]] = {}
+        self._node_meta_cache: Dict[str, NodeMeta] = {}
+        self._node_meta_generation = 0
+        self.incomplete_count = 0
 
     def __del__(self):
         self._reset_cam()
@@ -45,6 +96,8 @@ class ImageAcquirer:
         self._system.ReleaseInstance()
 
     def update_device_list(self):
+        # Release the previous list first so it does not keep references to the old cameras
+        self._device_list.Clear()
         self._device_list = self._system.GetCameras()
 
     def get_device_count(self, update_list: bool = True) -> int:
@@ -52,16 +105,7 @@ class ImageAcquirer:
             self.update_device_list()
         return self._device_list.GetSize()
 
-    def init_device(
-        self,
-        device_serial: str = None,
-        device_index: int = None,
-    ) -> bool:
-        # reset cam
-        self._reset_cam()
-
-        self.update_device_list()
-
+    def _find_device(self, device_serial: str = None, device_index: int = None) -> Optional[PySpin.Camera]:
         candidate_devices: List[PySpin.Camera] = []
 
         if device_serial is not None:
@@ -70,12 +114,28 @@ class ImageAcquirer:
         if device_index is not None and device_index < self.get_device_count(update_list=False):
             candidate_devices.append(self._device_list.GetByIndex(device_index))
 
-        self._current_device = next((dev for dev in candidate_devices if dev and dev.IsValid()), None)
+        return next((dev for dev in candidate_devices if dev and dev.IsValid()), None)
+
+    def init_device(
+        self,
+        device_serial: str = None,
+        device_index: int = None,
+    ) -> bool:
+        # reset cam
+        self._reset_cam()
+
+        # Only enumerate the bus again if the device is not in the current list
+        self._current_device = self._find_device(device_serial, device_index)
+        if self._current_device is None:
+            self.update_device_list()
+            self._current_device = self._find_device(device_serial, device_index)
 
         if self._current_device is None:
             raise ValueError(f"No device with serial number '{device_serial}' or index '{device_index}' is available")
+        self._state = CameraState.SELECTED
 
         self._current_device.Init()
+        self._state = CameraState.INITIALIZED
 
         # Ensure that acquisition is stopped
         try:
@@ -86,290 +146,346 @@ class ImageAcquirer:
         return True
 
     def is_initialized(self):
-        return self._current_device is not None and self._current_device.IsInitialized
+        return self._state >= CameraState.INITIALIZED
 
     def _reset_cam(self):
         if self._current_device is not None and self._current_device.IsValid():
             try:
-                if self._current_device.IsStreaming():
+                if self._state >= CameraState.STREAMING:
                     self.end_acquisition()
-                if self._current_device.IsInitialized():
+                if self._state >= CameraState.INITIALIZED:
                     self._current_device.DeInit()
             except Exception as ex:
                 Gst.error(f"Error: {ex}")
 
+        self._state = CameraState.NONE
+
         self._device_node_map = None
         self._tl_device_node_map = None
         self._tl_stream_node_map = None
+        self._node_cache = {}
+        self._node_meta_cache = {}
 
         del self._current_device
         self._current_device = None
 
     def start_acquisition(self):
+        if self._state >= CameraState.STREAMING:
+            raise ValueError("Acquisition has already been started")
+
         self.set_node_val("AcquisitionMode", "Continuous")
+
         try:
             self._current_device.BeginAcquisition()
+            self._state = CameraState.STREAMING
+            self.incomplete_count = 0
         except PySpin.SpinnakerException as ex:
             raise ValueError(f"Error: {ex}")
+        finally:
+            # Streaming locks the transport layer parameters
+            self._invalidate_node_meta()
 
     def end_acquisition(self):
         try:
-            self._current_device.EndAcquisition()
+            if self._state >= CameraState.STREAMING:
+                self._current_device.EndAcquisition()
         except PySpin.SpinnakerException as ex:
             raise ValueError(f"Error: {ex}")
+        finally:
+            self._state = min(self._state, CameraState.INITIALIZED)
+            self._invalidate_node_meta()
+            if self.incomplete_count > 0:
+                Gst.warning(f"Dropped {self.incomplete_count} incomplete images")
 
-    def get_next_image(self, logger: Callable[[str], None] = None) -> Tuple[np.ndarray, int, int]:
-
-        spinnaker_image = None
-
-        while spinnaker_image is None or spinnaker_image.IsIncomplete():
+    def get_next_image(self, image_buffer: np.ndarray) -> Tuple[int, int]:
+        if self._state < CameraState.STREAMING:
+            raise ValueError("Acquisition has not been started")
 
+        try:
             spinnaker_image = self._current_device.GetNextImage(self.TIMEOUT_MS)
-
-            if spinnaker_image.IsIncomplete():
-                if logger:
-                    logger(f"Image incomplete with image status {spinnaker_image.GetImageStatus()}")
+            # GetNextImage blocks until the next image arrives, incomplete ones are released without being copied
+            while spinnaker_image.IsIncomplete():
+                self.incomplete_count += 1
+                if _debug_level_enabled(Gst.DebugLevel.DEBUG):
+                    Gst.debug(f"Image incomplete with image status {spinnaker_image.GetImageStatus()}")
                 spinnaker_image.Release()
+                spinnaker_image = self._current_device.GetNextImage(self.TIMEOUT_MS)
+        except PySpin.SpinnakerException as ex:
+            raise ValueError(f"Error: {ex}")
 
-        image_array = spinnaker_image.GetData()
-
-        image_timestamp = spinnaker_image.GetTimeStamp()
-
-        image_frame_id = spinnaker_image.GetFrameID()
-
-        spinnaker_image.Release()
+        try:
+            # Copy straight out of the Spinnaker buffer while it is still held,
+            # the image data is only valid until the image is released
+            image_data = np.frombuffer(spinnaker_image.GetData(), dtype=np.uint8)
+            if image_data.size > image_buffer.size:
+                raise ValueError(f"Image of {image_data.size} bytes does not fit in a {image_buffer.size} byte buffer")
+            ctypes.memmove(image_buffer.ctypes.data, image_data.ctypes.data, image_data.size)
 
-        return (image_array, image_frame_id, image_timestamp)
+            return (spinnaker_image.GetFrameID(), spinnaker_image.GetTimeStamp())
+        finally:
+            spinnaker_image.Release()
 
     def _get_device_node_map(self) -> PySpin.NodeMap:
-        if (
-            self._current_device is None
-            or not self._current_device.IsValid()
-            or not self._current_device.IsInitialized()
-        ):
+        if self._state < CameraState.INITIALIZED:
             raise ValueError("No device has been selected and initialied")
         if self._device_node_map is None:
             self._device_node_map = self._current_device.GetNodeMap()
         return self._device_node_map
 
     def _get_tl_device_node_map(self) -> PySpin.NodeMap:
-        if self._current_device is None or not self._current_device.IsValid():
+        if self._state < CameraState.SELECTED:
             raise ValueError("No device has been selected")
         if self._tl_device_node_map is None:
             self._tl_device_node_map = self._current_device.GetTLDeviceNodeMap()
         return self._tl_device_node_map
 
     def _get_tl_stream_node_map(self) -> PySpin.NodeMap:
-        if self._current_device is None or not self._current_device.IsValid():
+        if self._state < CameraState.SELECTED:
             raise ValueError("No device has been selected")
         if self._tl_stream_node_map is None:
             self._tl_stream_node_map = self._current_device.GetTLStreamNodeMap()
         return self._tl_stream_node_map
 
     def _get_device_id(self) -> Optional[str]:
-        if self._current_device is None or not self._current_device.IsValid():
+        if self._state < CameraState.SELECTED:
             return None
         return self._current_device.TLDevice.DeviceSerialNumber.GetValue()
 
     def _get_node(self, node_name: str) -> PySpin.INodeMap:
-        device_node = self._get_device_node_map().GetNode(node_name)
-        if device_node is not None:
-            return device_node
+        if node_name in self._node_cache:
+            return self._node_cache[node_name]
+
+        node = self._get_device_node_map().GetNode(node_name)
+
+        if node is None:
+            node = self._get_tl_device_node_map().GetNode(node_name)
+
+        if node is None:
+            node = self._get_tl_stream_node_map().GetNode(node_name)
+
+        self._node_cache[node_name] = node
+        return node
+
+    def _get_node_meta(self, node_name: str) -> NodeMeta:
+        node_meta = self._node_meta_cache.get(node_name)
+
+        if node_meta is None:
+            node: PySpin.INode = self._get_node(node_name)
+            if node is None:
+                raise ValueError(f"{node_name} node is not available")
+            elif not hasattr(node, "GetPrincipalInterfaceType"):
+                raise ValueError(f"Could not determine the type of node: {node_name}")
+
+            node_type = node.GetPrincipalInterfaceType()
+            node_pointer_type = self._NODE_POINTER_TYPES.get(node_type)
+            node_meta = NodeMeta(
+                node=(node if node_pointer_type is None else node_pointer_type(node)),
+                node_type=node_type,
+                getter=self._NODE_GETTERS.get(node_type),
+                setter=self._NODE_SETTERS.get(node_type),
+            )
+            self._node_meta_cache[node_name] = node_meta
 
-        tl_device_node = self._get_tl_device_node_map().GetNode(node_name)
-        if tl_device_node is not None:
-            return tl_device_node
+        if node_meta.generation != self._node_meta_generation:
+            access_mode = node_meta.node.GetAccessMode()
+            node_meta.readable = access_mode in (PySpin.RO, PySpin.RW)
+            node_meta.writable = access_mode in (PySpin.WO, PySpin.RW)
+            node_meta.node_range = None
+            node_meta.generation = self._node_meta_generation
 
-        tl_stream_node = self._get_tl_stream_node_map().GetNode(node_name)
-        if tl_stream_node is not None:
-            return tl_stream_node
+        return node_meta
 
-        return None
+    def _invalidate_node_meta(self):
+        # Writes can change the access mode and range of other nodes (e.g. Width limits OffsetX)
+        self._node_meta_generation += 1
 
     def node_available(self, node_name: str) -> bool:
         node = self._get_node(node_name)
         return node is not None and PySpin.IsAvailable(node)
 
     def get_node_val(self, node_name: str) -> Any:
-        node: PySpin.INode = self._get_node(node_name)
-        if node is None:
-            raise ValueError(f"{node_name} node is not available")
-        elif "GetPrincipalInterfaceType" not in dir(node):
-            raise ValueError(f"Could not determine the type of node: {node_name}")
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIInteger:
-            return self._get_int_node_val(PySpin.CIntegerPtr(node))
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIFloat:
-            return self._get_float_node_val(PySpin.CFloatPtr(node))
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIBoolean:
-            return self._get_bool_node_val(PySpin.CBooleanPtr(node))
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIEnumeration:
-            return self._get_enum_node_val(PySpin.CEnumerationPtr(node))
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIString:
-            return self._get_string_node_val(PySpin.CStringPtr(node))
-        elif node.GetPrincipalInterfaceType() == PySpin.intfICommand:
+        node_meta = self._get_node_meta(node_name)
+        if node_meta.getter is not None:
+            return node_meta.getter(self, node_meta)
+        elif node_meta.node_type == PySpin.intfICommand:
             raise NotImplementedError("No getter implemented for command nodes")
         else:
-            raise ValueError(f"{node_name} node is of unknown type: {node.GetPrincipalInterfaceType()}")
+            raise ValueError(f"{node_name} node is of unknown type: {node_meta.node_type}")
 
     def set_node_val(self, node_name: str, value: Any):
-        node: PySpin.INode = self._get_node(node_name)
-        if node is None:
-            raise ValueError(f"{node_name} node is not available")
-        elif "GetPrincipalInterfaceType" not in dir(node):
-            raise ValueError(f"Could not determine the type of node: {node_name}")
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIInteger:
-            return self._set_int_node_val(PySpin.CIntegerPtr(node), value)
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIFloat:
-            return self._set_float_node_val(PySpin.CFloatPtr(node), value)
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIBoolean:
-            return self._set_bool_node_val(PySpin.CBooleanPtr(node), value)
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIEnumeration:
-            return self._set_enum_node_val(PySpin.CEnumerationPtr(node), value)
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIString:
-            return self._set_string_node_val(PySpin.CStringPtr(node), value)
-        elif node.GetPrincipalInterfaceType() == PySpin.intfICommand:
+        node_meta = self._get_node_meta(node_name)
+        if node_meta.setter is not None:
+            try:
+                return node_meta.setter(self, node_meta, value)
+            finally:
+                self._invalidate_node_meta()
+        elif node_meta.node_type == PySpin.intfICommand:
             raise NotImplementedError("No setter implemented for command nodes")
         else:
-            raise ValueError(f"{node_name} node is of unknown type: {node.GetPrincipalInterfaceType()}")
+            raise ValueError(f"{node_name} node is of unknown type: {node_meta.node_type}")
 
     def execute_node(self, node_name: str):
-        node: PySpin.INode = self._get_node(node_name)
-        if node is None:
-            raise ValueError(f"{node_name} node is not available")
-        elif "GetPrincipalInterfaceType" not in dir(node):
-            raise ValueError(f"Could not determine the type of node: {node_name}")
-        elif node.GetPrincipalInterfaceType() == PySpin.intfICommand:
-            self._execute_command_node(node_name)
+        node_meta = self._get_node_meta(node_name)
+        if node_meta.node_type == PySpin.intfICommand:
+            try:
+                self._execute_command_node(node_name)
+            finally:
+                self._invalidate_node_meta()
         else:
-            raise ValueError(f"Cannot execute {node_name} node of type: {node.GetPrincipalInterfaceType()}")
+            raise ValueError(f"Cannot execute {node_name} node of type: {node_meta.node_type}")
 
     def get_node_range(self, node_name: str) -> Tuple[Any, Any]:
-        node: PySpin.INode = self._get_node(node_name)
-        if node is None:
-            raise ValueError(f"{node_name} node is not available")
-        elif "GetPrincipalInterfaceType" not in dir(node):
-            raise ValueError(f"Could not determine the type of node: {node_name}")
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIInteger:
-            return self._get_int_node_range(PySpin.CIntegerPtr(node))
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIFloat:
-            return self._get_float_node_range(PySpin.CFloatPtr(node))
+        node_meta = self._get_node_meta(node_name)
+        range_getter = self._NODE_RANGE_GETTERS.get(node_meta.node_type)
+        if range_getter is not None:
+            return range_getter(self, node_meta)
         else:
-            raise ValueError(f"Range not available for {node_name} node of type: {node.GetPrincipalInterfaceType()}")
+            raise ValueError(f"Range not available for {node_name} node of type: {node_meta.node_type}")
 
     def get_node_entries(self, node_name: str) -> List[Any]:
-        node: PySpin.INode = self._get_node(node_name)
-        if node is None:
-            raise ValueError(f"{node_name} node is not available")
-        elif "GetPrincipalInterfaceType" not in dir(node):
-            raise ValueError(f"Could not determine the type of node: {node_name}")
-        elif node.GetPrincipalInterfaceType() == PySpin.intfIEnumeration:
-            return self._get_available_enum_entries(PySpin.CEnumerationPtr(node))
+        node_meta = self._get_node_meta(node_name)
+        if node_meta.node_type == PySpin.intfIEnumeration:
+            return self._get_available_enum_entries(node_meta)
         else:
-            raise ValueError(f"Range not available for {node_name} node of type: {node.GetPrincipalInterfaceType()}")
-
-    def _get_int_node_val(self, int_node: PySpin.CIntegerPtr) -> int:
-        if not PySpin.IsAvailable(int_node) or not PySpin.IsReadable(int_node):
-            raise ValueError(f"Integer node '{int_node.GetDisplayName()}' is not readable")
-        return int_node.GetValue(IgnoreCache=True)
-
-    def _get_int_node_range(self, int_node: PySpin.CIntegerPtr) -> Tuple[int, int]:
-        if not PySpin.IsAvailable(int_node) or not PySpin.IsReadable(int_node):
-            raise ValueError(f"Integer node '{int_node.GetDisplayName()}' is not writable")
-        return (int_node.GetMin(), int_node.GetMax())
-
-    def _set_int_node_val(self, int_node: PySpin.CIntegerPtr, value: int):
-        if not PySpin.IsAvailable(int_node) or not PySpin.IsWritable(int_node):
-            raise ValueError(f"Integer node '{int_node.GetDisplayName()}' is not writable")
-
-        min_val, max_val = self._get_int_node_range(int_node)
-        if value < min_val:
-            Gst.warning(f"{int_node.GetDisplayName()}: {value} is out of range [{min_val}, {max_val}], using {min_val}")
-            value = min_val
-        if value > max_val:
-            Gst.warning(f"{int_node.GetDisplayName()}: {value} is out of range [{min_val}, {max_val}], using {max_val}")
-            value = max_val
-
-        int_node.SetValue(int(value))
-
-    def _get_float_node_val(self, float_node: PySpin.CFloatPtr) -> float:
-        if not PySpin.IsAvailable(float_node) or not PySpin.IsReadable(float_node):
-            raise ValueError(f"Float node '{float_node.GetDisplayName()}' is not readable")
-        return float_node.GetValue(IgnoreCache=True)
-
-    def _get_float_node_range(self, float_node: PySpin.CFloatPtr) -> Tuple[float, float]:
-        if not PySpin.IsAvailable(float_node) or not PySpin.IsReadable(float_node):
-            raise ValueError(f"Float node '{float_node.GetDisplayName()}' is not readable")
-        return (float_node.GetMin(), float_node.GetMax())
-
-    def _set_float_node_val(self, float_node: PySpin.CFloatPtr, value: float):
-        if not PySpin.IsAvailable(float_node) or not PySpin.IsWritable(float_node):
-            raise ValueError(f"Float node '{float_node.GetDisplayName()}' is not writable")
-
-        min_val, max_val = self._get_float_node_range(float_node)
-        if value < min_val:
+            raise ValueError(f"Range not available for {node_name} node of type: {node_meta.node_type}")
+
+    def _get_int_node_val(self, int_meta: NodeMeta) -> int:
+        if not int_meta.readable:
+            raise ValueError(f"Integer node '{int_meta.node.GetDisplayName()}' is not readable")
+        return int_meta.node.GetValue(IgnoreCache=True)
+
+    def _get_int_node_range(self, int_meta: NodeMeta) -> Tuple[int, int]:
+        if not int_meta.readable:
+            raise ValueError(f"Integer node '{int_meta.node.GetDisplayName()}' is not writable")
+        if int_meta.node_range is None:
+            int_meta.node_range = (int_meta.node.GetMin(), int_meta.node.GetMax())
+        return int_meta.node_range
+
+    def _set_int_node_val(self, int_meta: NodeMeta, value: int):
+        if not int_meta.writable:
+            raise ValueError(f"Integer node '{int_meta.node.GetDisplayName()}' is not writable")
+
+        min_val, max_val = self._get_int_node_range(int_meta)
+        clamped_value = min(max(value, min_val), max_val)
+        if clamped_value != value:
             Gst.warning(
-                f"{float_node.GetDisplayName()}: {value} is out of range [{min_val}, {max_val}], using {min_val}"
+                f"{int_meta.node.GetDisplayName()}: {value} is out of range [{min_val}, {max_val}], "
+                f"using {clamped_value}"
             )
-            value = min_val
-        if value > max_val:
+            value = clamped_value
+
+        int_meta.node.SetValue(int(value))
+
+    def _get_float_node_val(self, float_meta: NodeMeta) -> float:
+        if not float_meta.readable:
+            raise ValueError(f"Float node '{float_meta.node.GetDisplayName()}' is not readable")
+        return float_meta.node.GetValue(IgnoreCache=True)
+
+    def _get_float_node_range(self, float_meta: NodeMeta) -> Tuple[float, float]:
+        if not float_meta.readable:
+            raise ValueError(f"Float node '{float_meta.node.GetDisplayName()}' is not readable")
+        if float_meta.node_range is None:
+            float_meta.node_range = (float_meta.node.GetMin(), float_meta.node.GetMax())
+        return float_meta.node_range
+
+    def _set_float_node_val(self, float_meta: NodeMeta, value: float):
+        if not float_meta.writable:
+            raise ValueError(f"Float node '{float_meta.node.GetDisplayName()}' is not writable")
+
+        min_val, max_val = self._get_float_node_range(float_meta)
+        clamped_value = min(max(value, min_val), max_val)
+        if clamped_value != value:
             Gst.warning(
-                f"{float_node.GetDisplayName()}: {value} is out of range [{min_val}, {max_val}], using {max_val}"
+                f"{float_meta.node.GetDisplayName()}: {value} is out of range [{min_val}, {max_val}], "
+                f"using {clamped_value}"
             )
-            value = max_val
+            value = clamped_value
 
-        float_node.SetValue(float(value))
+        float_meta.node.SetValue(float(value))
 
-    def _get_bool_node_val(self, bool_node: PySpin.CBooleanPtr) -> bool:
-        if not PySpin.IsAvailable(bool_node) or not PySpin.IsReadable(bool_node):
-            raise ValueError(f"Boolean node '{bool_node.GetDisplayName()}' is not readable")
-        return bool_node.GetValue(IgnoreCache=True)
+    def _get_bool_node_val(self, bool_meta: NodeMeta) -> bool:
+        if not bool_meta.readable:
+            raise ValueError(f"Boolean node '{bool_meta.node.GetDisplayName()}' is not readable")
+        return bool_meta.node.GetValue(IgnoreCache=True)
 
-    def _set_bool_node_val(self, bool_node: PySpin.CBooleanPtr, value: bool):
-        if not PySpin.IsAvailable(bool_node) or not PySpin.IsWritable(bool_node):
-            raise ValueError(f"Boolean node '{bool_node.GetDisplayName()}' is not writable")
+    def _set_bool_node_val(self, bool_meta: NodeMeta, value: bool):
+        if not bool_meta.writable:
+            raise ValueError(f"Boolean node '{bool_meta.node.GetDisplayName()}' is not writable")
 
-        bool_node.SetValue(bool(value))
+        bool_meta.node.SetValue(bool(value))
 
-    def _get_available_enum_entries(self, enum_node: PySpin.CEnumerationPtr) -> List[str]:
-        if not PySpin.IsAvailable(enum_node) or not PySpin.IsReadable(enum_node):
-            raise ValueError(f"Enumeration node '{enum_node.GetDisplayName()}' is not readable")
+    def _get_available_enum_entries(self, enum_meta: NodeMeta) -> List[str]:
+        if not enum_meta.readable:
+            raise ValueError(f"Enumeration node '{enum_meta.node.GetDisplayName()}' is not readable")
 
         available_entries = [
-            PySpin.CEnumEntryPtr(pf).GetSymbolic() for pf in enum_node.GetEntries() if PySpin.IsAvailable(pf)
+            PySpin.CEnumEntryPtr(pf).GetSymbolic() for pf in enum_meta.node.GetEntries() if PySpin.IsAvailable(pf)
         ]
         return available_entries
 
-    def _get_enum_node_val(self, enum_node: PySpin.CEnumerationPtr) -> str:
-        if not PySpin.IsAvailable(enum_node) or not PySpin.IsReadable(enum_node):
-            raise ValueError(f"Enumeration node '{enum_node.GetDisplayName()}' is not readable")
-        return enum_node.GetCurrentEntry(IgnoreCache=True).GetSymbolic()
+    def _get_enum_node_val(self, enum_meta: NodeMeta) -> str:
+        if not enum_meta.readable:
+            raise ValueError(f"Enumeration node '{enum_meta.node.GetDisplayName()}' is not readable")
+        return enum_meta.node.GetCurrentEntry(IgnoreCache=True).GetSymbolic()
 
-    def _set_enum_node_val(self, enum_node: PySpin.CEnumerationPtr, value: str):
-        if not PySpin.IsAvailable(enum_node) or not PySpin.IsWritable(enum_node):
+    def _set_enum_node_val(self, enum_meta: NodeMeta, value: str):
+        enum_node: PySpin.CEnumerationPtr = enum_meta.node
+        if not enum_meta.writable:
             raise ValueError(f"Enumeration node '{enum_node.GetDisplayName()}' is not writable")
 
-        enum_entry = enum_node.GetEntryByName(str(value))
-        if not PySpin.IsAvailable(enum_entry) or not PySpin.IsReadable(enum_entry):
-            raise ValueError(f"Entry '{value}' for enumeration node '{enum_node.GetDisplayName()}' is not available")
+        # Entry values are fixed by the camera description so only look each one up once
+        entry_value = enum_meta.enum_entries.get(str(value))
+        if entry_value is None:
+            enum_entry = enum_node.GetEntryByName(str(value))
+            if not PySpin.IsAvailable(enum_entry) or not PySpin.IsReadable(enum_entry):
+                raise ValueError(
+                    f"Entry '{value}' for enumeration node '{enum_node.GetDisplayName()}' is not available"
+                )
+            entry_value = enum_entry.GetValue()
+            enum_meta.enum_entries[str(value)] = entry_value
 
-        enum_node.SetIntValue(enum_entry.GetValue())
+        try:
+            enum_node.SetIntValue(entry_value)
+        except PySpin.SpinnakerException as ex:
+            raise ValueError(f"Could not set enumeration node '{enum_node.GetDisplayName()}' to '{value}': {ex}")
 
-    def _get_string_node_val(self, string_node: PySpin.CStringPtr) -> str:
-        if not PySpin.IsAvailable(string_node) or not PySpin.IsReadable(string_node):
-            raise ValueError(f"String node '{string_node.GetDisplayName()}' is not readable")
-        return string_node.GetValue(IgnoreCache=True)
+    def _get_string_node_val(self, string_meta: NodeMeta) -> str:
+        if not string_meta.readable:
+            raise ValueError(f"String node '{string_meta.node.GetDisplayName()}' is not readable")
+        return string_meta.node.GetValue(IgnoreCache=True)
 
-    def _set_string_node_val(self, string_node: PySpin.CStringPtr, value: str):
-        if not PySpin.IsAvailable(string_node) or not PySpin.IsWritable(string_node):
-            raise ValueError(f"String node '{string_node.GetDisplayName()}' is not writable")
-        string_node.SetValue(str(value))
+    def _set_string_node_val(self, string_meta: NodeMeta, value: str):
+        if not string_meta.writable:
+            raise ValueError(f"String node '{string_meta.node.GetDisplayName()}' is not writable")
+        string_meta.node.SetValue(str(value))
 
     def _execute_command_node(self, node_name: str):
-        command_node = PySpin.CCommandPtr(self._get_node(node_name))
-        if not PySpin.IsAvailable(command_node) or not PySpin.IsWritable(command_node):
+        command_meta = self._get_node_meta(node_name)
+        if not command_meta.writable:
             raise ValueError(f"Error: Command node '{node_name}' is not writable")
 
-        command_node.Execute()
+        command_meta.node.Execute()
+
+    _NODE_GETTERS = {
+        PySpin.intfIInteger: _get_int_node_val,
+        PySpin.intfIFloat: _get_float_node_val,
+        PySpin.intfIBoolean: _get_bool_node_val,
+        PySpin.intfIEnumeration: _get_enum_node_val,
+        PySpin.intfIString: _get_string_node_val,
+    }
+
+    _NODE_SETTERS = {
+        PySpin.intfIInteger: _set_int_node_val,
+        PySpin.intfIFloat: _set_float_node_val,
+        PySpin.intfIBoolean: _set_bool_node_val,
+        PySpin.intfIEnumeration: _set_enum_node_val,
+        PySpin.intfIString: _set_string_node_val,
+    }
+
+    _NODE_RANGE_GETTERS = {
+        PySpin.intfIInteger: _get_int_node_range,
+        PySpin.intfIFloat: _get_float_node_range,
+    }
 
 
 class PySpinSrc(GstBase.PushSrc):
@@ -395,9 +511,15 @@ class PySpinSrc(GstBase.PushSrc):
     DEFAULT_NUM_BUFFERS = 10
     DEFAULT_SERIAL_NUMBER = None
     DEFAULT_USER_SET = "Default"
+    DEFAULT_LATEST_ONLY = False
+    DEFAULT_RT_PRIORITY = 0
 
     MILLISECONDS_PER_NANOSECOND = 1000000
 
+    MAX_MAPPED_ARRAYS = 16
+    MAX_FRAMERATE_DENOMINATOR = 1000
+    FRAMERATE_TOLERANCE = 0.01
+
     __gstmetadata__ = ("pyspinsrc", "Src", "PySpin src element", "Brian Ofrim")
 
     __gsttemplates__ = Gst.PadTemplate.new(
@@ -561,6 +683,22 @@ class PySpinSrc(GstBase.PushSrc):
             DEFAULT_USER_SET,
             GObject.ParamFlags.READWRITE,
         ),
+        "latest-only": (
+            bool,
+            "latest image only",
+            "Only keep the newest image, dropping older ones when downstream falls behind",
+            DEFAULT_LATEST_ONLY,
+            GObject.ParamFlags.READWRITE,
+        ),
+        "rt-priority": (
+            int,
+            "realtime priority",
+            "SCHED_FIFO priority for the streaming thread while it runs this element, 0 keeps the default scheduling",
+            0,
+            99,
+            DEFAULT_RT_PRIORITY,
+            GObject.ParamFlags.READWRITE,
+        ),
     }
 
     @dataclass
@@ -589,6 +727,9 @@ class PySpinSrc(GstBase.PushSrc):
         PixelFormatType(cap_type=BAYER_CAP_TYPE, gst="grbg", genicam="BayerGR8"),
     ]
 
+    PIXEL_FORMATS_BY_GST = {pf.gst.lower(): pf for pf in SUPPORTED_PIXEL_FORMATS}
+    PIXEL_FORMATS_BY_GENICAM = {pf.genicam.lower(): pf for pf in SUPPORTED_PIXEL_FORMATS}
+
     # GST function
     def __init__(self):
         super(PySpinSrc, self).__init__()
@@ -616,6 +757,8 @@ class PySpinSrc(GstBase.PushSrc):
         self.num_cam_buffers: int = self.DEFAULT_NUM_BUFFERS
         self.serial: str = self.DEFAULT_SERIAL_NUMBER
         self.user_set: str = self.DEFAULT_USER_SET
+        self.latest_only: bool = self.DEFAULT_LATEST_ONLY
+        self.rt_priority: int = self.DEFAULT_RT_PRIORITY
 
         # Camera capabilities
         self.camera_caps = None
@@ -623,6 +766,17 @@ class PySpinSrc(GstBase.PushSrc):
         # Image Capture Device
         self.image_acquirer: Optional[ImageAcquirer] = None
 
+        # Array views over mapped buffer memory, keyed by address and size
+        self._mapped_arrays: Dict[Tuple[int, int], np.ndarray] = {}
+
+        # Per buffer logging, checked once per caps change rather than per frame
+        self._log_enabled: bool = False
+
+        # The streaming thread only exists once streaming starts, its priority is raised on the first fill.
+        # The thread comes from a shared pool so its original scheduling is restored when the task leaves it
+        self._rt_priority_applied: bool = False
+        self._saved_scheduling: Optional[Tuple[int, Any]] = None
+
         # Buffer timing
         self.timestamp_offset: int = 0
         self.previous_timestamp: int = 0
@@ -669,12 +823,17 @@ class PySpinSrc(GstBase.PushSrc):
             return self.serial
         elif prop.name == "user-set":
             return self.user_set
+        elif prop.name == "latest-only":
+            return self.latest_only
+        elif prop.name == "rt-priority":
+            return self.rt_priority
         else:
             raise AttributeError("unknown property %s" % prop.name)
 
     # GST function
     def do_set_property(self, prop: GObject.GParamSpec, value):
-        Gst.info(f"Setting {prop.name} = {value}")
+        if _debug_level_enabled(Gst.DebugLevel.INFO):
+            Gst.info(f"Setting {prop.name} = {value}")
         if prop.name == "auto-exposure":
             self.auto_exposure = value
             if self.image_acquirer is not None and self.image_acquirer.is_initialized():
@@ -721,22 +880,20 @@ class PySpinSrc(GstBase.PushSrc):
             self.serial = value
         elif prop.name == "user-set":
             self.user_set = value
+        elif prop.name == "latest-only":
+            self.latest_only = value
+        elif prop.name == "rt-priority":
+            self.rt_priority = value
         else:
             raise AttributeError("unknown property %s" % prop.name)
 
     # helper function
     def get_format_from_genicam(self, genicam_format: str) -> Optional[PixelFormatType]:
-        return next(
-            (f for f in self.SUPPORTED_PIXEL_FORMATS if f.genicam.lower() == genicam_format.lower()),
-            None,
-        )
+        return self.PIXEL_FORMATS_BY_GENICAM.get(genicam_format.lower())
 
     # helper function
     def get_format_from_gst(self, gst_format: str) -> Optional[PixelFormatType]:
-        return next(
-            (f for f in self.SUPPORTED_PIXEL_FORMATS if f.gst.lower() == gst_format.lower()),
-            None,
-        )
+        return self.PIXEL_FORMATS_BY_GST.get(gst_format.lower())
 
     # helper function
     def cam_node_available(self, node_name: str) -> bool:
@@ -764,7 +921,8 @@ class PySpinSrc(GstBase.PushSrc):
             return
         try:
             self.image_acquirer.set_node_val(node_name, value)
-            if log_value:
+            # Reading the value back costs another camera round trip, only do it when it will be logged
+            if log_value and _debug_level_enabled(Gst.DebugLevel.INFO):
                 node_value = self.image_acquirer.get_node_val(node_name)
                 if node_value == value:
                     Gst.info(f"{node_name}: {node_value}")
@@ -773,13 +931,23 @@ class PySpinSrc(GstBase.PushSrc):
         except (ValueError, NotImplementedError) as ex:
             Gst.warning(f"Warning: {ex}")
 
+    # helper function
+    def update_cam_node_val(self, node_name: str, value, current_value, tolerance: float = 0, log_value: bool = True):
+        # Renegotiating often requests what the camera already has, skip the register write in that case.
+        # Callers pass the value they already read from the device so the check costs no extra round trip
+        if current_value is not None and (
+            current_value == value or (tolerance > 0 and abs(current_value - value) <= tolerance)
+        ):
+            return
+        self.set_cam_node_val(node_name, value, log_value)
+
     # helper function
     def execute_cam_node(self, node_name: str, log_execution: bool = True):
         if self.image_acquirer is None:
             return
         try:
             self.image_acquirer.execute_node(node_name)
-            if log_execution:
+            if log_execution and _debug_level_enabled(Gst.DebugLevel.INFO):
                 Gst.info(f"{node_name} executed")
         except (ValueError, NotImplementedError) as ex:
             Gst.warning(f"Warning: {ex}")
@@ -811,7 +979,7 @@ class PySpinSrc(GstBase.PushSrc):
             self.set_cam_node_val("UserSetSelector", self.user_set)
             self.execute_cam_node("UserSetLoad")
 
-            self.set_cam_node_val("StreamBufferHandlingMode", "OldestFirst")
+            self.set_cam_node_val("StreamBufferHandlingMode", "NewestOnly" if self.latest_only else "OldestFirst")
             self.set_cam_node_val("StreamBufferCountMode", "Manual")
             self.set_cam_node_val("StreamBufferCountManual", self.num_cam_buffers)
 
@@ -839,23 +1007,17 @@ class PySpinSrc(GstBase.PushSrc):
                 self.set_cam_node_val("GainAuto", "Off")
 
             if self.cam_node_available("BalanceWhiteAuto"):
-                manual_wb = False
+                # Every write is a register access over the camera link, select the mode once up front
+                manual_wb = self.wb_blue >= 0 or self.wb_red >= 0
+                self.set_cam_node_val("BalanceWhiteAuto", "Continuous" if self.auto_wb and not manual_wb else "Off")
+
                 if self.wb_blue >= 0:
-                    self.set_cam_node_val("BalanceWhiteAuto", "Off")
                     self.set_cam_node_val("BalanceRatioSelector", "Blue")
                     self.set_cam_node_val("BalanceRatio", self.wb_blue)
-                    manual_wb = True
 
                 if self.wb_red >= 0:
-                    self.set_cam_node_val("BalanceWhiteAuto", "Off")
                     self.set_cam_node_val("BalanceRatioSelector", "Red")
                     self.set_cam_node_val("BalanceRatio", self.wb_red)
-                    manual_wb = True
-
-                if self.auto_wb and not manual_wb:
-                    self.set_cam_node_val("BalanceWhiteAuto", "Continuous")
-                else:
-                    self.set_cam_node_val("BalanceWhiteAuto", "Off")
 
             if self.cam_node_available("GammaEnable"):
                 self.set_cam_node_val("GammaEnable", self.enable_gamma)
@@ -878,15 +1040,13 @@ class PySpinSrc(GstBase.PushSrc):
 
         genicam_formats = self.get_cam_node_entries("PixelFormat")
 
-        supported_pixel_formats = [self.get_format_from_genicam(pf) for pf in genicam_formats]
-
-        supported_pixel_formats = [pf for pf in supported_pixel_formats if pf is not None]
+        supported_pixel_formats = [
+            pf for pf in (self.get_format_from_genicam(genicam_pf) for genicam_pf in genicam_formats) if pf is not None
+        ]
 
         camera_caps = Gst.Caps.new_empty()
 
         for pixel_format in supported_pixel_formats:
-            if pixel_format is None:
-                continue
             camera_caps.append_structure(
                 Gst.Structure(
                     pixel_format.cap_type,
@@ -903,9 +1063,12 @@ class PySpinSrc(GstBase.PushSrc):
         Gst.info("Setting caps")
 
         self.info.from_caps(caps)
+        self._mapped_arrays.clear()
+        self._log_enabled = _debug_level_enabled(Gst.DebugLevel.LOG)
         self.set_blocksize(self.info.size if self.info.size > 0 else self.info.width * self.info.height)
 
-        Gst.info(f"Blocksize: {self.get_blocksize()} bytes")
+        if _debug_level_enabled(Gst.DebugLevel.INFO):
+            Gst.info(f"Blocksize: {self.get_blocksize()} bytes")
 
         if self.image_acquirer is None:
             return False
@@ -923,14 +1086,11 @@ class PySpinSrc(GstBase.PushSrc):
     # GST function
     def do_get_caps(self, filter: Gst.Caps) -> Gst.Caps:
         Gst.info("Get Caps")
-        caps = None
+        # The base class only intersects the returned caps, share the cached caps instead of copying them
+        caps = self.camera_caps if self.camera_caps is not None else Gst.Caps.new_any()
 
-        if self.camera_caps is not None:
-            caps = Gst.Caps.copy(self.camera_caps)
-        else:
-            caps = Gst.Caps.new_any()
-
-        Gst.info(f"Avaliable caps: {caps.to_string()}")
+        if _debug_level_enabled(Gst.DebugLevel.INFO):
+            Gst.info(f"Avaliable caps: {caps.to_string()}")
         return caps
 
     # GST function
@@ -939,20 +1099,27 @@ class PySpinSrc(GstBase.PushSrc):
 
         structure = caps.get_structure(0).copy()
 
-        Gst.info(f"Incoming caps: {structure}")
+        if _debug_level_enabled(Gst.DebugLevel.INFO):
+            Gst.info(f"Incoming caps: {structure}")
 
         genicam_format = self.get_cam_node_val("PixelFormat")
         genicam_pixel_format_type = self.get_format_from_genicam(genicam_format)
         if genicam_pixel_format_type is not None:
             structure.fixate_field_string("format", genicam_pixel_format_type.gst)
 
+        # Write in dependency order: the pixel format constrains the region of interest and each
+        # dimension constrains its offset, so writing offsets last avoids clamping against stale limits
         gst_pixel_format_type = self.get_format_from_gst(structure.get_value("format"))
         if gst_pixel_format_type is not None:
-            self.set_cam_node_val("PixelFormat", gst_pixel_format_type.genicam)
+            self.update_cam_node_val("PixelFormat", gst_pixel_format_type.genicam, genicam_format)
 
         height = self.get_cam_node_val("Height")
         structure.fixate_field_nearest_int("height", height)
-        self.set_cam_node_val("Height", structure.get_value("height"))
+        self.update_cam_node_val("Height", structure.get_value("height"), height)
+
+        width = self.get_cam_node_val("Width")
+        structure.fixate_field_nearest_int("width", width)
+        self.update_cam_node_val("Width", structure.get_value("width"), width)
 
         if self.center_y:
             self.set_cam_node_val(
@@ -962,10 +1129,6 @@ class PySpinSrc(GstBase.PushSrc):
         else:
             self.set_cam_node_val("OffsetY", self.offset_y)
 
-        width = self.get_cam_node_val("Width")
-        structure.fixate_field_nearest_int("width", width)
-        self.set_cam_node_val("Width", structure.get_value("width"))
-
         if self.center_x:
             self.set_cam_node_val(
                 "OffsetX",
@@ -980,11 +1143,24 @@ class PySpinSrc(GstBase.PushSrc):
             self.set_cam_node_val("AcquisitionFrameRateAuto", "Off")
             self.set_cam_node_val("AcquisitionFrameRateEnabled", True)
 
-        frame_rate = self.get_cam_node_val("AcquisitionFrameRate")
-        structure.fixate_field_nearest_fraction("framerate", frame_rate, 1)
-        self.set_cam_node_val("AcquisitionFrameRate", float(structure.get_value("framerate")), True)
+        # An unreadable framerate was already reported, leave the field for Gst.Caps.fixate in that case
+        camera_frame_rate = self.get_cam_node_val("AcquisitionFrameRate")
+        if camera_frame_rate is not None:
+            # Fraction fields take an integer numerator and denominator, not the float the camera reports
+            frame_rate = fractions.Fraction(camera_frame_rate).limit_denominator(self.MAX_FRAMERATE_DENOMINATOR)
+            if structure.has_field("framerate"):
+                structure.fixate_field_nearest_fraction("framerate", frame_rate.numerator, frame_rate.denominator)
+            else:
+                structure.set_value("framerate", Gst.Fraction(frame_rate.numerator, frame_rate.denominator))
+            self.update_cam_node_val(
+                "AcquisitionFrameRate",
+                float(structure.get_value("framerate")),
+                camera_frame_rate,
+                tolerance=self.FRAMERATE_TOLERANCE,
+            )
 
-        Gst.info(f"Fixated caps: {structure}")
+        if _debug_level_enabled(Gst.DebugLevel.INFO):
+            Gst.info(f"Fixated caps: {structure}")
 
         new_caps = Gst.Caps.new_empty()
         new_caps.append_structure(structure)
@@ -994,6 +1170,7 @@ class PySpinSrc(GstBase.PushSrc):
     # GST function
     def do_start(self) -> bool:
         Gst.info("Starting")
+        self._rt_priority_applied = False
         try:
             self.image_acquirer = ImageAcquirer()
 
@@ -1021,6 +1198,7 @@ class PySpinSrc(GstBase.PushSrc):
     # GST function
     def do_stop(self) -> bool:
         Gst.info("Stopping")
+        self._mapped_arrays.clear()
         if self.image_acquirer is None:
             return True
         try:
@@ -1030,22 +1208,66 @@ class PySpinSrc(GstBase.PushSrc):
             Gst.error(f"Error: {ex}")
         return True
 
+    # GST function
+    def do_post_message(self, message: Gst.Message) -> bool:
+        # The pad task posts its LEAVE status from the streaming thread itself, just before handing it back to the pool
+        if message.type == Gst.MessageType.STREAM_STATUS:
+            status_type, _ = message.parse_stream_status()
+            if status_type == Gst.StreamStatusType.LEAVE:
+                self._restore_scheduling()
+        return GstBase.PushSrc.do_post_message(self, message)
+
     # GST function
     def do_get_times(self, buffer: Gst.Buffer) -> Tuple[int, int]:
-        end = 0
-        start = 0
-        if self.is_live:
-            ts = buffer.pts
-            if ts != Gst.CLOCK_TIME_NONE:
-                duration = buffer.duration
-                if duration != Gst.CLOCK_TIME_NONE:
-                    end = ts + duration
-                start = ts
-        else:
-            start = Gst.CLOCK_TIME_NONE
-            end = Gst.CLOCK_TIME_NONE
+        if not self.is_live:
+            return _CLOCK_TIME_NONE, _CLOCK_TIME_NONE
+
+        ts = buffer.pts
+        if ts == _CLOCK_TIME_NONE:
+            return 0, 0
+
+        duration = buffer.duration
+        return ts, (0 if duration == _CLOCK_TIME_NONE else ts + duration)
 
-        return start, end
+    def _apply_rt_priority(self):
+        self._rt_priority_applied = True
+        if self.rt_priority <= 0:
+            return
+        if not hasattr(os, "sched_setscheduler"):
+            Gst.warning("Warning: realtime scheduling is not supported on this platform")
+            return
+        try:
+            # On Linux pid 0 refers to the calling thread, so only the streaming thread is affected
+            saved_scheduling = (os.sched_getscheduler(0), os.sched_getparam(0))
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.rt_priority))
+            if self._saved_scheduling is None:
+                self._saved_scheduling = saved_scheduling
+            Gst.info(f"Streaming thread scheduled with SCHED_FIFO priority {self.rt_priority}")
+        except OSError as ex:
+            Gst.warning(f"Warning: could not set realtime priority {self.rt_priority}: {ex}")
+
+    def _restore_scheduling(self):
+        self._rt_priority_applied = False
+        if self._saved_scheduling is None:
+            return
+        policy, param = self._saved_scheduling
+        self._saved_scheduling = None
+        try:
+            os.sched_setscheduler(0, policy, param)
+            Gst.info("Streaming thread scheduling restored")
+        except OSError as ex:
+            Gst.warning(f"Warning: could not restore streaming thread scheduling: {ex}")
+
+    def _get_mapped_array(self, mapped: ctypes.Array) -> np.ndarray:
+        # Pooled buffers are recycled so the same memory is mapped over and over, reuse its array view
+        key = (ctypes.addressof(mapped), len(mapped))
+        mapped_array = self._mapped_arrays.get(key)
+        if mapped_array is None:
+            if len(self._mapped_arrays) >= self.MAX_MAPPED_ARRAYS:
+                self._mapped_arrays.clear()
+            mapped_array = np.ndarray(len(mapped), buffer=mapped, dtype=np.uint8)
+            self._mapped_arrays[key] = mapped_array
+        return mapped_array
 
     # GST function
     def do_gst_push_src_fill(self, buffer: Gst.Buffer) -> Gst.FlowReturn:
@@ -1054,15 +1276,17 @@ class PySpinSrc(GstBase.PushSrc):
                 Gst.error(f"Error: missing image acquirer")
                 return Gst.FlowReturn.ERROR
 
-            (
-                image_array,
-                image_frame_id,
-                image_timestamp_ns,
-            ) = self.image_acquirer.get_next_image(logger=Gst.warning)
+            if not self._rt_priority_applied:
+                self._apply_rt_priority()
 
+            # PyGObject holds an extra reference to the buffer inside the vfunc so it is not writable and a WRITE
+            # map is rejected, map for READ as the base class allocated memory is ours to fill regardless
             with map_gst_buffer(buffer, Gst.MapFlags.READ) as mapped:
-                mapped_array = np.ndarray(image_array.shape, buffer=mapped, dtype=image_array.dtype)
-                mapped_array[:] = image_array
+                mapped_array = self._get_mapped_array(mapped)
+                (
+                    image_frame_id,
+                    image_timestamp_ns,
+                ) = self.image_acquirer.get_next_image(mapped_array)
 
             if self.timestamp_offset == 0:
                 self.timestamp_offset = image_timestamp_ns
@@ -1075,12 +1299,12 @@ class PySpinSrc(GstBase.PushSrc):
 
             self.previous_timestamp = image_timestamp_ns
 
-            Gst.log(
-                f"Sending buffer of size: {image_array.nbytes} bytes, "
-                f"type: {image_array.dtype}, "
-                f"offset: {image_frame_id}"
-                f"timestamp offset: {buffer.pts // self.MILLISECONDS_PER_NANOSECOND}ms"
-            )
+            if self._log_enabled:
+                Gst.log(
+                    f"Sending buffer of size: {buffer.get_size()} bytes, "
+                    f"offset: {image_frame_id}, "
+                    f"timestamp offset: {buffer.pts // self.MILLISECONDS_PER_NANOSECOND}ms"
+                )
 
         except Exception as ex:
             Gst.error(f"Error: {ex}")